@@ -3,6 +3,9 @@ from __future__ import unicode_literals
 
 import six
 
+# private so that no stored value can be mistaken for a missing key
+_MISSING = object()
+
 
 class LazyDict(dict):
     def __init__(self, *args, **kwargs):
@@ -10,34 +13,43 @@ class LazyDict(dict):
         dict.__init__(self, *args, **kwargs)
 
     def __getattr__(self, attr):
-        if attr in self:
-            return self[attr]
-        raise AttributeError("'%s' object has no attribute '%s'"
-                             % (self.__class__.__name__, attr))
+        try:
+            return dict.__getitem__(self, attr)
+        except KeyError:
+            raise AttributeError('%r object has no attribute %r'
+                                 % (self.__class__.__name__, attr)) from None
 
     def __setattr__(self, item, value):
+        d = self.__dict__
         # this test allows attributes to be set in the __init__ method
-        if '_ld_initialized' not in self.__dict__ or not self.__dict__['_ld_initialized']:
-            self.__dict__[item] = value
+        if not d.get('_ld_initialized'):
+            d[item] = value
         # any normal attributes are handled normally when they already exist
         # this would happen if they are given different values after initilization
-        elif item in self.__dict__:
-            self.__dict__[item] = value
+        elif item in d:
+            d[item] = value
         # if there is a property, then set use it
-        elif item in self.__class__.__dict__ and isinstance(self.__class__.__dict__[item],
-                                                            property):
+        elif isinstance(self.__class__.__dict__.get(item), property):
             self.__class__.__dict__[item].__set__(self, value)
         # attributes added after initialization are stored in _data
         else:
             self[item] = value
 
     def __delattr__(self, name):
-        del self[name]
+        if dict.pop(self, name, _MISSING) is _MISSING:
+            raise AttributeError(name)
 
 
 class _Attribute(six.text_type):
     def __add__(self, other):
-        return _Attribute('{0} {1}'.format(self, other).lstrip(' '))
+        # attributes usually start out empty, so skip the separator in that case
+        if not self:
+            return _Attribute(six.text_type(other).lstrip(' '))
+        return _Attribute(' '.join((self, six.text_type(other))).lstrip(' '))
+
+
+# _Attribute is immutable, so missing attributes can all share one empty value
+_EMPTY_ATTRIBUTE = _Attribute()
 
 
 class HTMLAttributes(LazyDict):
@@ -46,25 +58,21 @@ class HTMLAttributes(LazyDict):
         self._clean_keys()
 
     def __getattr__(self, attr):
-        attr = self._clean_key(attr)
-        if attr not in self:
-            self[attr] = _Attribute()
-        return self[attr]
+        return dict.setdefault(self, self._clean_key(attr), _EMPTY_ATTRIBUTE)
 
     def __getitem__(self, key):
-        key = self._clean_key(key)
-        if key not in self:
-            self[key] = _Attribute()
-        return LazyDict.__getitem__(self, key)
+        return dict.setdefault(self, self._clean_key(key), _EMPTY_ATTRIBUTE)
 
     def __setattr__(self, item, value):
         item = self._clean_key(item)
-        value = _Attribute(value)
+        if not isinstance(value, _Attribute):
+            value = _Attribute(value)
         LazyDict.__setattr__(self, item, value)
 
     def __setitem__(self, key, value):
         key = self._clean_key(key)
-        value = _Attribute(value)
+        if not isinstance(value, _Attribute):
+            value = _Attribute(value)
         LazyDict.__setitem__(self, key, value)
 
     def _clean_key(self, key):
@@ -73,13 +81,20 @@ class HTMLAttributes(LazyDict):
         return key
 
     def _clean_keys(self):
-        old_keys = list(self.keys())
-        for key in old_keys:
+        # nothing to do unless some key needs its trailing underscore removed
+        if not any(key.endswith('_') for key in dict.keys(self)):
+            return
+        # build the cleaned items in one pass rather than renaming keys while
+        # iterating over them; renamed keys win over clean duplicates and have
+        # their values wrapped, same as going through __setitem__
+        cleaned = {}
+        renamed = {}
+        for key, value in dict.items(self):
             new_key = self._clean_key(key)
-            if new_key != key:
-                # have to use LazyDict b/c our __getitem__ will clean `key` and
-                # give us an empty value because the cleaned key obviously
-                # does not exist ye
-                value = LazyDict.__getitem__(self, key)
-                self[new_key] = value
-                del self[key]
+            if new_key == key:
+                cleaned[key] = value
+            else:
+                renamed[new_key] = _Attribute(value)
+        cleaned.update(renamed)
+        dict.clear(self)
+        dict.update(self, cleaned)
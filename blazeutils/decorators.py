@@ -5,16 +5,17 @@ from __future__ import unicode_literals
 import functools
 from functools import partial
 import inspect
-import itertools
 import logging
 import time
-from traceback import format_exc
+from traceback import format_exc, format_exception
 import sys
 import warnings
 
 import wrapt
 import six
-from six.moves import range, map
+from six.moves import range
+
+from blazeutils.sentinels import NotGiven
 
 log = logging.getLogger(__name__)
 
@@ -53,7 +54,18 @@ def format_argspec_plus(fn, grouped=True):
     """
     warnings.warn('format_argspec_plus is deprecated and will be removed.', DeprecationWarning, 2)
     spec = callable(fn) and inspect.getargspec(fn) or fn
-    args = inspect.formatargspec(*spec)
+    args, varargs, varkw, defaults = spec
+    # defaults only show up in the output through their repr, so the reprs are
+    # what gets cached on; unlike the values, they are always hashable and
+    # never compare equal across types (e.g. True and 1)
+    if defaults is not None:
+        defaults = tuple(repr(value) for value in defaults)
+    return dict(_format_argspec_plus((tuple(args), varargs, varkw, defaults), grouped))
+
+
+@functools.lru_cache(maxsize=2048)
+def _format_argspec_plus(spec, grouped):
+    args = inspect.formatargspec(*spec, formatvalue=lambda x: '=' + x)
     if spec[0]:
         self_arg = spec[0][0]
     elif spec[1]:
@@ -75,14 +87,16 @@ def format_argspec_plus(fn, grouped=True):
 def unique_symbols(used, *bases):
     used = set(used)
     for base in bases:
-        pool = itertools.chain((base,), map(lambda i: base + str(i), range(1000)))
-        for sym in pool:
-            if sym not in used:
-                used.add(sym)
-                yield sym
-                break
-        else:
-            raise NameError("exhausted namespace for symbol base %s" % base)
+        sym = base
+        if sym in used:
+            for i in range(1000):
+                sym = base + str(i)
+                if sym not in used:
+                    break
+            else:
+                raise NameError("exhausted namespace for symbol base %s" % base)
+        used.add(sym)
+        yield sym
 
 
 def decorator(target):
@@ -152,6 +166,8 @@ class curry(object):
         toolz.curried - namespace of curried functions
         http://toolz.readthedocs.org/en/latest/curry.html
     """
+    __slots__ = ('func', 'args', 'keywords', '__name__', '_required', '__weakref__')
+
     def __init__(self, func, *args, **kwargs):
         if not callable(func):
             raise TypeError("Input must be callable")
@@ -159,11 +175,26 @@ class curry(object):
         self.func = func
         self.args = args
         self.keywords = kwargs if kwargs else None
-        self.__doc__ = self.func.__doc__
         try:
             self.__name__ = self.func.__name__
         except AttributeError:
             pass
+        # only inspected once a call fails, see __call__
+        self._required = NotGiven
+
+    def __getstate__(self):
+        # the required arg count isn't pickled, it's cheap to work out again
+        state = {'func': self.func, 'args': self.args, 'keywords': self.keywords}
+        try:
+            state['__name__'] = self.__name__
+        except AttributeError:
+            pass
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._required = NotGiven
 
     def __str__(self):
         return str(self.func)
@@ -186,7 +217,9 @@ class curry(object):
         try:
             return self.func(*args, **kwargs)
         except TypeError:
-            required_args = _num_required_args(self.func)
+            required_args = self._required
+            if required_args is NotGiven:
+                required_args = self._required = _num_required_args(self.func)
 
             # If there was a genuine TypeError
             if required_args is not None and len(args) >= required_args:
@@ -199,7 +232,25 @@ class curry(object):
                 else:
                     return partial(self.func, *args)
 
-            return curry(self.func, *args, **kwargs)
+            curried = curry(self.func, *args, **kwargs)
+            # same function, so the new curry can reuse the inspection
+            curried._required = required_args
+            return curried
+
+
+class _CurryDoc(object):
+    """
+        Gives curry instances the docstring of the function they wrap, since
+        __doc__ can't be a slot on a class that has its own docstring.
+    """
+    def __init__(self, doc):
+        self.doc = doc
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self.doc
+        return instance.func.__doc__
+curry.__doc__ = _CurryDoc(curry.__doc__)  # noqa: E305
 
 
 def deprecate(message):
@@ -214,7 +265,22 @@ def deprecate(message):
     return wrapper
 
 
-def exc_emailer(send_mail_func, logger=None, catch=Exception, print_to_stderr=True):
+class _LazyTraceback(object):
+    """
+        Stands in for a formatted traceback, only building the string when
+        str() is called on it.
+    """
+    __slots__ = ('exc_info', )
+
+    def __init__(self, exc_info):
+        self.exc_info = exc_info
+
+    def __str__(self):
+        return ''.join(format_exception(*self.exc_info))
+
+
+def exc_emailer(send_mail_func, logger=None, catch=Exception, print_to_stderr=True,
+                lazy_traceback=False):
     """
         Catch exceptions and email them using `send_mail_func` which should
         accept a single string argument which will be the traceback to be
@@ -227,6 +293,10 @@ def exc_emailer(send_mail_func, logger=None, catch=Exception, print_to_stderr=Tr
         to an Exception class or tuple of exception classes that should be
         handled.
 
+        Set `lazy_traceback` if `send_mail_func` only ever calls str() on its
+        argument. It will then be given an object that formats the traceback
+        on demand instead of a string built before every call.
+
     """
     # if they don't give a logger, use our own
     if logger is None:
@@ -234,16 +304,16 @@ def exc_emailer(send_mail_func, logger=None, catch=Exception, print_to_stderr=Tr
 
     @wrapt.decorator
     def wrapper(wrapped, instance, args, kwargs):
-        exc_info = None
+        body = exc_info = None
         try:
             return wrapped(*args, **kwargs)
         except catch as e:
-            body = format_exc()
             exc_info = sys.exc_info()
+            body = _LazyTraceback(exc_info) if lazy_traceback else format_exc()
             error_msg = 'exc_mailer() caught an exception, email will be sent.'
             logger.exception(error_msg)
             if print_to_stderr:
-                print(error_msg + '  ' + str(e), file=sys.stderr)
+                sys.stderr.write('{}  {}\n'.format(error_msg, e))
             try:
                 send_mail_func(body)
             except Exception:
@@ -251,10 +321,10 @@ def exc_emailer(send_mail_func, logger=None, catch=Exception, print_to_stderr=Tr
                                  'logging it & then re-raising original exception')
                 six.reraise(exc_info[0], exc_info[1], exc_info[2])
         finally:
-            # delete the traceback so we don't have garbage collection issues.
+            # drop the traceback, and a lazy body holding it, so we don't have
+            # garbage collection issues.
             # see warning at: http://docs.python.org/library/sys.html#sys.exc_info
-            if exc_info is not None:
-                del exc_info
+            body = exc_info = None
     return wrapper
 
 
@@ -270,7 +340,7 @@ class Retry(object):
         msg = a string that the exception must contain in order to be caught
         """
         self.tries = tries
-        if isinstance(exceptions, Exception):
+        if isinstance(exceptions, type) and issubclass(exceptions, BaseException):
             self.exceptions = (exceptions, )
         else:
             self.exceptions = exceptions
@@ -284,23 +354,48 @@ class Retry(object):
         self.msg = msg
 
     def __call__(self, fn):
+        if self.tries <= 1:
+            # nothing to retry, so skip the loop and the sleep bookkeeping
+            return self._wrap_single(fn)
+        return self._wrap_retry(fn)
+
+    def _wrap_single(self, fn):
+        exceptions, log, log_level, msg = self.exceptions, self.log, self.log_level, self.msg
+
+        @functools.wraps(fn)
+        def wrapfn(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except exceptions as e:
+                if msg is None or msg in str(e):
+                    log.log(log_level, "Retry, exception: {}".format(e))
+                raise
+
+        return wrapfn
+
+    def _wrap_retry(self, fn):
+        # bind settings as closure variables so the retry loop doesn't look
+        # them up on self for every attempt
+        tries, exceptions, delay = self.tries, self.exceptions, self.delay
+        log, log_level, msg = self.log, self.log_level, self.msg
+
         @functools.wraps(fn)
         def wrapfn(*args, **kwargs):
-            for try_count in range(self.tries):
+            for try_count in range(tries):
                 try:
                     return fn(*args, **kwargs)
-                except self.exceptions as e:
-                    if self.msg is not None and self.msg not in str(e):
+                except exceptions as e:
+                    if msg is not None and msg not in str(e):
                         raise
 
                     message = "Retry, exception: {}".format(e)
-                    self.log.log(self.log_level, message)
+                    log.log(log_level, message)
 
-                    if try_count == self.tries - 1:
+                    if try_count == tries - 1:
                         # no tries left, reraise
                         raise
 
-                    time.sleep(self.delay)
+                    time.sleep(delay)
 
         return wrapfn
 retry = Retry  # noqa: E305
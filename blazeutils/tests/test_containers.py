@@ -1,9 +1,11 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import pytest
 import six.moves.cPickle as pickle
 
-from blazeutils.containers import LazyDict, HTMLAttributes
+from blazeutils.containers import LazyDict, HTMLAttributes, _Attribute
+from blazeutils.sentinels import NotGiven
 
 
 def test_lazy_dict():
@@ -27,6 +29,40 @@ def test_lazy_dict():
     del o.c
     assert not hasattr(o, 'c')
 
+    with pytest.raises(AttributeError):
+        del o.c
+
+
+def test_lazy_dict_missing_attribute_has_no_key_error_context():
+    o = LazyDict()
+
+    with pytest.raises(AttributeError) as excinfo:
+        o.d
+    assert excinfo.value.__context__ is None or excinfo.value.__suppress_context__
+
+
+def test_lazy_dict_delete_sentinel_values():
+    o = LazyDict(a=None)
+    o.b = NotGiven
+
+    del o.a
+    del o.b
+    assert o == {}
+
+
+def test_lazy_dict_delayed_initialization():
+
+    class DelayedLD(LazyDict):
+        def __init__(self):
+            LazyDict.__init__(self, _ld_initialize=False)
+            self.foo = 1
+            self._ld_initialized = True
+
+    o = DelayedLD()
+    o.bar = 2
+    assert o.foo == 1
+    assert dict(o) == {'bar': 2}
+
 
 def test_lazy_dict_with_setter_property():
 
@@ -48,6 +84,15 @@ def test_lazy_dict_with_setter_property():
     assert not o.x
 
 
+def test_attribute_add():
+    assert _Attribute() + 'foo' == 'foo'
+    assert _Attribute() + ' foo' == 'foo'
+    assert _Attribute('foo') + 'bar' == 'foo bar'
+    assert _Attribute(' foo') + 'bar' == 'foo bar'
+    assert _Attribute('foo') + 1 == 'foo 1'
+    assert isinstance(_Attribute('foo') + 'bar', _Attribute)
+
+
 class TestAttributes(object):
 
     def check_eq(self, expected, **kwargs):
@@ -104,3 +149,23 @@ class TestAttributes(object):
     def test_init_from_kwargs(self):
         at = HTMLAttributes(name='foo', class_='bar baz')
         self.check_eq({'class': 'bar baz', 'name': 'foo'}, **at)
+
+    def test_add_attribute_after_init(self):
+        at = HTMLAttributes(name='foo', class_='bar')
+        at.class_ += 'baz'
+        self.check_eq({'class': 'bar baz', 'name': 'foo'}, **at)
+
+    def test_init_keeps_non_string_values(self):
+        at = HTMLAttributes(disabled=None, size=3, class_='foo')
+        self.check_eq({'class': 'foo', 'disabled': None, 'size': 3}, **at)
+        assert at['disabled'] is None
+        assert at['size'] == 3
+
+        at = HTMLAttributes(disabled=None, size=3)
+        assert at['disabled'] is None
+        assert at['size'] == 3
+
+    def test_init_from_html_attributes(self):
+        at = HTMLAttributes(HTMLAttributes(name='foo', class_='bar'))
+        at.class_ += 'baz'
+        self.check_eq({'class': 'bar baz', 'name': 'foo'}, **at)
@@ -1,14 +1,23 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
+import gc
+import inspect
+import pickle
 import warnings
+import weakref
 
 import logging
 
 import pytest
 from mock import Mock, patch, call
 
-from blazeutils.decorators import curry, decorator
-from blazeutils.decorators import exc_emailer, retry, hybrid_method
+from blazeutils.decorators import curry, decorator, deprecate
+from blazeutils.decorators import exc_emailer, retry, hybrid_method, unique_symbols, \
+    format_argspec_plus
+
+
+def _add(a, b):
+    return a+b
 
 
 def test_curry():
@@ -35,6 +44,104 @@ def test_two_currys():
     assert f2(1) == 3
 
 
+def test_curry_doc():
+
+    @curry
+    def myfunc(a, b):
+        """myfunc docs"""
+        return a+b
+
+    assert myfunc.__doc__ == 'myfunc docs'
+    assert curry.__doc__.strip().startswith('Curry a callable function')
+
+
+def test_curry_pickle():
+    add = curry(_add)
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        add2 = pickle.loads(pickle.dumps(add, protocol))
+        assert add2.__name__ == '_add'
+        assert add2(1)(2) == 3
+
+    add_one = pickle.loads(pickle.dumps(curry(_add, b=1), 0))
+    assert add_one(2) == 3
+
+
+def test_curry_weakref():
+
+    @curry
+    def myfunc(a, b):
+        return a+b
+
+    assert weakref.ref(myfunc)() is myfunc
+
+
+def test_curry_does_not_keep_callable_alive():
+
+    class Adder(object):
+        def add(self, a, b):
+            return a+b
+
+    adder = Adder()
+    ref = weakref.ref(adder)
+    add = curry(adder.add)
+    assert add(1)(2) == 3
+
+    del adder, add
+    gc.collect()
+    assert ref() is None
+
+
+def test_curry_unhashable_callable():
+
+    class Adder(object):
+        __hash__ = None
+
+        def __call__(self, a, b):
+            return a+b
+
+    add = curry(Adder())
+    assert add(1)(2) == 3
+
+
+@pytest.mark.skipif(not hasattr(inspect, 'formatargspec'),
+                    reason='inspect.formatargspec was removed in Python 3.11')
+class TestFormatArgspecPlus(object):
+
+    def setup_method(self, method):
+        warnings.filterwarnings('ignore', category=DeprecationWarning)
+
+    def test_formatting(self):
+        assert format_argspec_plus(lambda self, a, b, c=3, **d: 123) == {
+            'args': '(self, a, b, c=3, **d)',
+            'self_arg': 'self',
+            'apply_kw': '(self, a, b, c=c, **d)',
+            'apply_pos': '(self, a, b, c, **d)',
+        }
+        assert format_argspec_plus(lambda *a: 123, grouped=False) == {
+            'args': '*a',
+            'self_arg': 'a[0]',
+            'apply_kw': '*a',
+            'apply_pos': '*a',
+        }
+
+    def test_equal_defaults_of_different_types(self):
+        assert format_argspec_plus(lambda a=1: a)['args'] == '(a=1)'
+        assert format_argspec_plus(lambda a=True: a)['args'] == '(a=True)'
+        assert format_argspec_plus(lambda a=1.0: a)['args'] == '(a=1.0)'
+
+    def test_unhashable_defaults(self):
+        assert format_argspec_plus(lambda a=[1], b={}: a)['args'] == '(a=[1], b={})'
+        assert format_argspec_plus((['a'], None, None, ([2], )))['args'] == '(a=[2])'
+
+
+def test_unique_symbols():
+    used = ['fn', 'fn0', 'target']
+    assert list(unique_symbols(used, 'fn', 'target', 'fn')) == ['fn1', 'target0', 'fn2']
+
+    with pytest.raises(NameError):
+        list(unique_symbols(['x'] + ['x{}'.format(i) for i in range(1000)], 'x'))
+
+
 def test_decorator():
     warnings.filterwarnings('ignore', category=DeprecationWarning)
 
@@ -49,6 +156,42 @@ def test_decorator():
     assert myfunc(5) == 9
 
 
+def test_deprecate():
+
+    @deprecate('myfunc is deprecated')
+    def myfunc(a, b=2):
+        """myfunc docs"""
+        return a + b
+
+    with pytest.warns(DeprecationWarning, match='myfunc is deprecated'):
+        assert myfunc(1, b=3) == 4
+    assert myfunc.__name__ == 'myfunc'
+    assert myfunc.__doc__ == 'myfunc docs'
+
+
+def test_deprecate_class():
+
+    @deprecate('MyClass is deprecated')
+    class MyClass(object):
+        pass
+
+    with pytest.warns(DeprecationWarning, match='MyClass is deprecated'):
+        obj = MyClass()
+    assert isinstance(obj, MyClass)
+
+
+def test_deprecate_classmethod():
+
+    class MyClass(object):
+        @deprecate('value is deprecated')
+        @classmethod
+        def value(cls):
+            return cls
+
+    with pytest.warns(DeprecationWarning, match='value is deprecated'):
+        assert MyClass.value() is MyClass
+
+
 class TestExcEmailer(object):
 
     @patch('blazeutils.decorators.log')
@@ -81,6 +224,55 @@ class TestExcEmailer(object):
         m_log.exception.assert_called_once_with('exc_mailer() caught an exception, '
                                                 'email will be sent.')
 
+    @patch('blazeutils.decorators.log')
+    def test_print_to_stderr(self, m_log, capsys):
+        send_mail = Mock()
+
+        @exc_emailer(send_mail)
+        def myfunc():
+            raise ValueError('test')
+
+        myfunc()
+
+        assert capsys.readouterr().err == \
+            'exc_mailer() caught an exception, email will be sent.  test\n'
+
+    @patch('blazeutils.decorators.log')
+    def test_lazy_traceback(self, m_log):
+        send_mail = Mock()
+
+        @exc_emailer(send_mail, print_to_stderr=False, lazy_traceback=True)
+        def myfunc():
+            raise ValueError('test')
+
+        myfunc()
+
+        assert send_mail.call_count == 1
+        traceback = str(send_mail.call_args[0][0])
+        assert 'Traceback' in traceback
+        assert 'raise ValueError(\'test\')' in traceback
+
+    @pytest.mark.parametrize('lazy_traceback', [False, True])
+    @patch('blazeutils.decorators.log')
+    def test_traceback_released(self, m_log, lazy_traceback):
+        class Local(object):
+            pass
+        refs = []
+
+        @exc_emailer(lambda body: str(body), print_to_stderr=False,
+                     lazy_traceback=lazy_traceback)
+        def myfunc():
+            local = Local()
+            refs.append(weakref.ref(local))
+            raise ValueError('test')
+
+        gc.disable()
+        try:
+            myfunc()
+            assert refs[0]() is None
+        finally:
+            gc.enable()
+
     @patch('blazeutils.decorators.log')
     def test_send_mail_func_exception(self, m_log):
 
@@ -180,6 +372,23 @@ class TestRetry(object):
             assert logger.log.call_count == 5
             assert logger.log.call_args.args[0] == 10
 
+    def test_single_try(self):
+        logger = Mock()
+
+        @retry(1, TypeError, delay=0.001, logger=logger)
+        def myfunc():
+            self.call_count += 1
+            raise TypeError('myfunc error')
+
+        with pytest.raises(TypeError, match='myfunc error'):
+            myfunc()
+        assert self.call_count == 1
+        assert logger.log.call_count == 1
+
+    def test_single_exception_class(self):
+        assert retry(5, TypeError).exceptions == (TypeError, )
+        assert retry(5, (ValueError, TypeError)).exceptions == (ValueError, TypeError)
+
     def test_msg_param(self):
         logger = Mock()
 